@@ -12,18 +12,77 @@ Features:
 
 Required installations:
 pip install streamlit matplotlib pandas textblob wordcloud
+
+Optional (faster journal loading and saving):
+pip install orjson
 """
 
 import streamlit as st
 import json
 import datetime
+import heapq
 from collections import Counter, defaultdict
-from textblob import TextBlob
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from wordcloud import WordCloud
-import re
 import io
+import os
+import string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+DREAMS_FILE = 'dreams.jsonl'
+LEGACY_DREAMS_FILE = 'dreams.json'
+DAMAGED_DREAMS_FILE = 'dreams.jsonl.damaged'
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_line(obj):
+        return orjson.dumps(obj) + b'\n'
+else:
+    _json_loads = json.loads
+
+    def _json_line(obj):
+        return (json.dumps(obj) + '\n').encode('utf-8')
+
+# Color mapping for emotions in charts
+EMOTION_COLORS = {
+    'Happy': 'gold', 'Scared': 'red', 'Confused': 'orange', 
+    'Excited': 'lime', 'Sad': 'blue', 'Anxious': 'purple',
+    'Peaceful': 'lightblue', 'Angry': 'darkred', 'Curious': 'green',
+    'Nostalgic': 'pink', 'Unknown': 'gray'
+}
+
+# Column types of the per-dream statistics frame
+FRAME_DTYPES = {
+    'lucid': 'bool',
+    'sleep_quality': 'int8'
+}
+
+# Chart row order for emotions; 'Unknown' is last and catches unlisted emotions
+EMOTION_LIST = list(EMOTION_COLORS)
+EMOTION_INDEX = {emotion: i for i, emotion in enumerate(EMOTION_LIST)}
+
+# Maps ASCII punctuation except '_' (a word character, as in the old \w+ regex),
+# the typographic quotes, dashes and ellipsis that phone and macOS keyboards
+# insert, and whitespace control characters to spaces. Other non-ASCII
+# punctuation such as «» or ¿¡ is not split off.
+_PUNCT_TABLE = str.maketrans({
+    c: ' ' for c in string.punctuation.replace('_', '') + '\u2018\u2019\u201c\u201d\u2013\u2014\u2026\n\t\r'
+})
+
+
+@dataclass
+class AnalysisSnapshot:
+    """Analysis report of one journal version, kept in session state"""
+    version: int
+    text: str
 
 
 class DreamJournal:
@@ -34,28 +93,109 @@ class DreamJournal:
         
         self.dreams = st.session_state.dreams
         
+        if 'aggregates' not in st.session_state:
+            self._init_aggregates()
+        
+        # Columnar view of the per-dream fields used by the statistics
+        if 'dream_frame' not in st.session_state:
+            st.session_state.dream_frame = _dream_frame(self.dreams)
+            
+        self.df = st.session_state.dream_frame
+        
     def load_dreams(self):
-        """Load dreams from JSON file"""
+        """Load dreams from JSON Lines file"""
+        dreams = []
+        damaged = []
+        try:
+            with open(DREAMS_FILE, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    # Skip damaged lines (e.g. an append cut short) instead of dropping the journal
+                    try:
+                        dreams.append(_json_loads(line))
+                    except ValueError:  # decode errors, including a line cut mid-character
+                        damaged.append(line.rstrip(b'\r\n') + b'\n')
+        except FileNotFoundError:
+            return self._migrate_legacy_dreams()
+            
+        if damaged:
+            self._quarantine_damaged_lines(dreams, damaged)
+        return dreams
+        
+    def _quarantine_damaged_lines(self, dreams, damaged):
+        """Move unreadable lines to a side file and rewrite the journal without them"""
         try:
-            with open('dreams.json', 'r') as f:
-                return json.load(f)
+            with open(DAMAGED_DREAMS_FILE, 'ab') as f:
+                f.writelines(damaged)
+        except Exception as e:
+            st.warning(f"Skipped {len(damaged)} unreadable line(s) in {DREAMS_FILE}; "
+                       f"they could not be moved aside and will not be repaired ({str(e)})")
+            return
+            
+        self.dreams = dreams
+        self.save_dreams()
+        st.warning(f"Moved {len(damaged)} unreadable line(s) from {DREAMS_FILE} to {DAMAGED_DREAMS_FILE}")
+            
+    def _migrate_legacy_dreams(self):
+        """Convert a legacy dreams.json file to JSON Lines on first run"""
+        try:
+            with open(LEGACY_DREAMS_FILE, 'rb') as f:
+                dreams = _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
             return []
             
+        self.dreams = dreams
+        self.save_dreams()
+        return dreams
+            
     def save_dreams(self):
-        """Save dreams to JSON file"""
+        """Rewrite the whole JSON Lines file from the dreams list"""
+        try:
+            with open(DREAMS_FILE, 'wb') as f:
+                f.writelines(_json_line(dream) for dream in self.dreams)
+            st.session_state.dreams = self.dreams
+        except Exception as e:
+            st.error(f"Failed to save dreams: {str(e)}")
+
+    def _append_dream(self, dream):
+        """Append a single dream to the JSON Lines file"""
         try:
-            with open('dreams.json', 'w') as f:
-                json.dump(self.dreams, f, indent=2)
+            with open(DREAMS_FILE, 'ab+') as f:
+                # Start on a fresh line if a previous append was cut short
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+                f.write(_json_line(dream))
             st.session_state.dreams = self.dreams
         except Exception as e:
             st.error(f"Failed to save dreams: {str(e)}")
 
+    def _init_aggregates(self):
+        """Build the running analysis counters from all loaded dreams"""
+        agg = {
+            'emotions': Counter(),
+            'sentiments': Counter(),
+            'tags': Counter(),
+            'words': Counter()
+        }
+        for dream in self.dreams:
+            self._update_aggregates(agg, dream)
+        st.session_state.aggregates = agg
+
+    @staticmethod
+    def _update_aggregates(agg, dream):
+        """Fold a single dream into the running analysis counters"""
+        agg['emotions'][dream.get('emotion', 'Unknown')] += 1
+        agg['sentiments'][dream.get('sentiment', 'neutral')] += 1
+        agg['tags'].update(dream.get('tags', ()))
+        agg['words'].update(dream.get('description', '').lower().translate(_PUNCT_TABLE).split())
+
     def analyze_sentiment(self, text):
         """Analyze sentiment of dream description using TextBlob"""
         try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity  # -1 to 1
+            polarity = _polarity(text)  # -1 to 1
             if polarity > 0.1:
                 return 'positive'
             elif polarity < -0.1:
@@ -78,7 +218,7 @@ class DreamJournal:
         
         # Create dream entry
         dream = {
-            'id': len(self.dreams) + 1,
+            'id': max((d.get('id', 0) for d in self.dreams), default=0) + 1,
             'date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'title': title.strip(),
             'description': description.strip(),
@@ -91,14 +231,21 @@ class DreamJournal:
         
         # Add to dreams list
         self.dreams.append(dream)
+        self._update_aggregates(st.session_state.aggregates, dream)
+        self.df = st.session_state.dream_frame = pd.concat(
+            [self.df, _dream_frame([dream])], ignore_index=True
+        )
+        if 'emotion_rgba' in st.session_state:
+            st.session_state.emotion_rgba = np.vstack([st.session_state.emotion_rgba, _emotion_rgba([dream])])
         
         # Save to file
-        self.save_dreams()
+        self._append_dream(dream)
         
         st.success("Dream saved successfully!")
         return True
 
-    def format_counter(self, counter_dict, indent=0):
+    @staticmethod
+    def format_counter(counter_dict, indent=0):
         """Format a counter dictionary for display"""
         if not counter_dict:
             return "  None"
@@ -108,30 +255,29 @@ class DreamJournal:
             formatted.append(f"{'  ' * indent}• {item}: {count}")
         return '\n'.join(formatted)
         
-    def generate_insights(self):
+    @staticmethod
+    def generate_insights(total_dreams, lucid_dreams, avg_quality, sentiment_counts):
         """Generate insights based on dream patterns"""
-        if not self.dreams:
+        if not total_dreams:
             return "Not enough data for insights."
             
         insights = []
         
         # Lucid dreaming insight
-        lucid_percentage = sum(1 for dream in self.dreams if dream.get('lucid', False)) / len(self.dreams) * 100
+        lucid_percentage = lucid_dreams / total_dreams * 100
         if lucid_percentage > 20:
             insights.append("• You have a high rate of lucid dreaming! This suggests good dream awareness.")
         elif lucid_percentage < 5:
             insights.append("• Consider practicing lucid dreaming techniques to increase awareness.")
             
         # Sleep quality insight
-        avg_quality = sum(dream.get('sleep_quality', 0) for dream in self.dreams) / len(self.dreams)
         if avg_quality < 5:
             insights.append("• Your sleep quality could be improved. Consider sleep hygiene practices.")
         elif avg_quality > 7:
             insights.append("• You maintain good sleep quality! Keep up the healthy habits.")
             
         # Sentiment insight
-        sentiments = [dream.get('sentiment', 'neutral') for dream in self.dreams]
-        positive_ratio = sentiments.count('positive') / len(sentiments) * 100
+        positive_ratio = sentiment_counts.get('positive', 0) / total_dreams * 100
         if positive_ratio > 60:
             insights.append("• Your dreams tend to be positive! This may reflect good mental wellbeing.")
         elif positive_ratio < 30:
@@ -144,69 +290,44 @@ class DreamJournal:
         if not self.dreams:
             return "No dreams recorded yet. Start by adding some dreams!"
             
-        # Calculate statistics
-        total_dreams = len(self.dreams)
-        lucid_dreams = sum(1 for dream in self.dreams if dream.get('lucid', False))
-        avg_sleep_quality = sum(dream.get('sleep_quality', 0) for dream in self.dreams) / total_dreams
-        
-        # Emotion analysis
-        emotions = [dream.get('emotion', 'Unknown') for dream in self.dreams]
-        emotion_counts = Counter(emotions)
-        most_common_emotion = emotion_counts.most_common(1)[0] if emotion_counts else ('None', 0)
-        
-        # Sentiment analysis
-        sentiments = [dream.get('sentiment', 'neutral') for dream in self.dreams]
-        sentiment_counts = Counter(sentiments)
-        
-        # Tag analysis
-        all_tags = []
-        for dream in self.dreams:
-            all_tags.extend(dream.get('tags', []))
-        tag_counts = Counter(all_tags)
-        common_tags = tag_counts.most_common(5)
+        # Reuse this session's report until the journal changes size
+        snap = st.session_state.get('analysis_snap')
+        if snap and snap.version == len(self.dreams):
+            return snap.text
+            
+        agg = st.session_state.aggregates
         
         # Recent dreams analysis
-        recent_dreams = sorted(self.dreams, key=lambda x: x.get('date', ''), reverse=True)[:5]
-        
-        # Word frequency analysis
-        all_text = ' '.join([dream.get('description', '') for dream in self.dreams])
-        words = re.findall(r'\b\w+\b', all_text.lower())
-        common_words = Counter(words).most_common(10)
-        
-        # Build analysis text
-        analysis = f"""
-DREAM JOURNAL ANALYSIS
-{'='*50}
-
-BASIC STATISTICS:
-• Total Dreams Recorded: {total_dreams}
-• Lucid Dreams: {lucid_dreams} ({lucid_dreams/total_dreams*100:.1f}%)
-• Average Sleep Quality: {avg_sleep_quality:.1f}/10
-
-EMOTIONAL PATTERNS:
-• Most Common Emotion: {most_common_emotion[0]} ({most_common_emotion[1]} times)
-• Emotion Distribution:
-{self.format_counter(emotion_counts, 2)}
-
-SENTIMENT ANALYSIS:
-• Positive Dreams: {sentiment_counts.get('positive', 0)}
-• Negative Dreams: {sentiment_counts.get('negative', 0)}
-• Neutral Dreams: {sentiment_counts.get('neutral', 0)}
-
-COMMON THEMES (Tags):
-{self.format_counter(dict(common_tags), 2) if common_tags else '  No tags found'}
-
-FREQUENT WORDS IN DREAMS:
-{self.format_counter(dict(common_words), 2)}
+        recent_dreams = heapq.nlargest(5, self.dreams, key=lambda x: x.get('date', ''))
+        recent_titles = tuple(
+            (dream.get('title', 'Untitled'), dream.get('date', 'Unknown date')[:10])
+            for dream in recent_dreams
+        )
+        
+        common_tags = tuple(agg['tags'].most_common(5))
+        common_words = tuple(agg['words'].most_common(10))
+        
+        # Lucid and sleep quality totals are column reductions over the typed frame
+        text = _compute_analysis(
+            len(self.df),
+            int(self.df.lucid.sum()),
+            float(self.df.sleep_quality.mean()),
+            tuple(agg['emotions'].items()),
+            tuple(agg['sentiments'].items()),
+            common_tags,
+            common_words,
+            recent_titles
+        )
+        
+        st.session_state.analysis_snap = AnalysisSnapshot(version=len(self.dreams), text=text)
+        return text
 
-RECENT DREAM TITLES:
-{chr(10).join([f"• {dream.get('title', 'Untitled')} ({dream.get('date', 'Unknown date')[:10]})" for dream in recent_dreams[:5]])}
-
-INSIGHTS:
-{self.generate_insights()}
-        """
-        
-        return analysis
+    def emotion_colors(self):
+        """Get the RGBA chart color of every dream's emotion"""
+        # Built on first chart render; save_dream appends the new dream's row
+        if 'emotion_rgba' not in st.session_state:
+            st.session_state.emotion_rgba = _emotion_rgba(self.dreams)
+        return st.session_state.emotion_rgba
 
     def show_emotion_timeline(self):
         """Show emotion timeline chart"""
@@ -215,26 +336,26 @@ INSIGHTS:
             return None
             
         # Prepare data
-        dates = [datetime.datetime.strptime(dream['date'][:10], '%Y-%m-%d') for dream in self.dreams]
-        emotions = [dream.get('emotion', 'Unknown') for dream in self.dreams]
+        dates = self.df.date
+        # Plot emotions as integer rows rather than string categories
+        emotion_rows = np.fromiter(
+            (EMOTION_INDEX.get(dream.get('emotion', 'Unknown'), len(EMOTION_LIST) - 1) for dream in self.dreams),
+            dtype=np.int8, count=len(self.dreams)
+        )
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
         fig.patch.set_facecolor('#2c3e50')
         ax.set_facecolor('#34495e')
         
-        # Color mapping for emotions
-        emotion_colors = {
-            'Happy': 'gold', 'Scared': 'red', 'Confused': 'orange', 
-            'Excited': 'lime', 'Sad': 'blue', 'Anxious': 'purple',
-            'Peaceful': 'lightblue', 'Angry': 'darkred', 'Curious': 'green',
-            'Nostalgic': 'pink', 'Unknown': 'gray'
-        }
-        
-        colors = [emotion_colors.get(emotion, 'gray') for emotion in emotions]
+        colors = self.emotion_colors()
         
         # Create scatter plot
-        ax.scatter(dates, emotions, c=colors, s=100, alpha=0.7)
+        ax.scatter(dates, emotion_rows, c=colors, s=100, alpha=0.7)
+        ax.set_yticks(range(len(EMOTION_LIST)))
+        ax.set_yticklabels(EMOTION_LIST)
         ax.set_xlabel('Date', color='white')
         ax.set_ylabel('Emotion', color='white')
         ax.set_title('Dream Emotions Over Time', color='white', fontsize=14, fontweight='bold')
@@ -246,10 +367,10 @@ INSIGHTS:
         ax.spines['right'].set_color('white')
         ax.spines['left'].set_color('white')
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
-        return fig
+        return _figure_png(fig)
         
     def show_word_cloud(self):
         """Show word cloud of dream tags and descriptions"""
@@ -257,38 +378,26 @@ INSIGHTS:
             st.info("No dreams to visualize yet!")
             return None
             
-        # Prepare text data
-        all_text = []
-        for dream in self.dreams:
-            all_text.append(dream.get('title', ''))
-            all_text.append(dream.get('description', ''))
-            all_text.extend(dream.get('tags', []))
-            
-        text = ' '.join(all_text)
-        
-        if not text.strip():
+        # Bound the cloud to the top terms of the running counters
+        agg = st.session_state.aggregates
+        stopwords = _stopwords()
+        frequencies = Counter({
+            word: count for word, count in agg['words'].most_common(500)
+            if word not in stopwords and len(word) > 2
+        })
+        # Fold tags into the same lowercased, filtered terms as the words
+        for tag, count in agg['tags'].most_common(100):
+            tag = tag.lower()
+            if tag not in stopwords and len(tag) > 2:
+                frequencies[tag] += count
+        
+        if not frequencies:
             st.info("No text data available for word cloud!")
             return None
             
         # Create word cloud
         try:
-            wordcloud = WordCloud(width=800, height=400, 
-                                background_color='#2c3e50',
-                                colormap='viridis',
-                                max_words=100).generate(text)
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(10, 6))
-            fig.patch.set_facecolor('#2c3e50')
-            
-            ax.imshow(wordcloud, interpolation='bilinear')
-            ax.axis('off')
-            ax.set_title('Dream Themes Word Cloud', color='white', 
-                        fontsize=14, fontweight='bold', pad=20)
-            
-            plt.tight_layout()
-            
-            return fig
+            return _render_wordcloud_png(tuple(frequencies.items()), 800, 400)
             
         except Exception as e:
             st.error(f"Could not generate word cloud: {str(e)}")
@@ -301,11 +410,13 @@ INSIGHTS:
             return None
             
         # Prepare data
-        dates = [datetime.datetime.strptime(dream['date'][:10], '%Y-%m-%d') for dream in self.dreams]
-        qualities = [dream.get('sleep_quality', 0) for dream in self.dreams]
+        dates = self.df.date
+        qualities = self.df.sleep_quality
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
         fig.patch.set_facecolor('#2c3e50')
         ax.set_facecolor('#34495e')
         
@@ -319,7 +430,7 @@ INSIGHTS:
                     fontsize=14, fontweight='bold')
         
         # Add average line
-        avg_quality = sum(qualities) / len(qualities)
+        avg_quality = qualities.mean()
         ax.axhline(y=avg_quality, color='red', linestyle='--', alpha=0.7, 
                   label=f'Average: {avg_quality:.1f}')
         
@@ -331,26 +442,29 @@ INSIGHTS:
         ax.spines['left'].set_color('white')
         ax.legend(facecolor='#34495e', edgecolor='white', labelcolor='white')
         
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
-        return fig
+        return _figure_png(fig)
 
     def search_dreams(self, query):
         """Search dreams based on query"""
         if not query:
             return []
             
+        if not self.dreams:
+            return []
+            
         query = query.lower()
-        results = []
-        for dream in self.dreams:
-            # Search in title, description, and tags
-            if (query in dream.get('title', '').lower() or
-                query in dream.get('description', '').lower() or
-                any(query in tag.lower() for tag in dream.get('tags', []))):
-                results.append(dream)
+        last_date = self.dreams[-1].get('date')
+        df = _search_frame(len(self.dreams), last_date, self.dreams)
+        
+        # Search in title, description, and tags
+        mask = (df.title_l.str.contains(query, regex=False) |
+                df.desc_l.str.contains(query, regex=False) |
+                df.tags_joined_l.str.contains(query, regex=False))
                 
-        return results
+        return [self.dreams[i] for i in df.index[mask].tolist()]
 
     def display_dreams(self, dreams, header="Dreams:"):
         """Display dreams in a formatted way"""
@@ -360,21 +474,25 @@ INSIGHTS:
             st.write(f"**{header}**\n")
             for i, dream in enumerate(dreams, 1):
                 with st.expander(f"{i}. {dream.get('title', 'Untitled')} - {dream.get('date', 'Unknown')[:10]}"):
-                    st.write(f"**Date:** {dream.get('date', 'Unknown')[:10]}")
-                    st.write(f"**Emotion:** {dream.get('emotion', 'Unknown')}")
-                    st.write(f"**Tags:** {', '.join(dream.get('tags', ['None']))}")
-                    st.write(f"**Sleep Quality:** {dream.get('sleep_quality', 'Unknown')}/10")
-                    st.write(f"**Lucid:** {'Yes' if dream.get('lucid', False) else 'No'}")
-                    st.write(f"**Description:** {dream.get('description', '')}")
-
-    def export_analysis(self):
+                    # One markdown element per dream instead of one per field
+                    st.markdown(
+                        f"**Date:** {dream.get('date', 'Unknown')[:10]}  \n"
+                        f"**Emotion:** {dream.get('emotion', 'Unknown')}  \n"
+                        f"**Tags:** {', '.join(dream.get('tags', ['None']))}  \n"
+                        f"**Sleep Quality:** {dream.get('sleep_quality', 'Unknown')}/10  \n"
+                        f"**Lucid:** {'Yes' if dream.get('lucid', False) else 'No'}\n\n"
+                        f"**Description:** {dream.get('description', '')}"
+                    )
+
+    def export_analysis(self, analysis_text=None):
         """Export analysis to a text file"""
         if not self.dreams:
             st.info("No dreams to export!")
             return None
             
         try:
-            analysis_text = self.get_analysis()
+            if analysis_text is None:
+                analysis_text = self.get_analysis()
             
             export_content = f"""DREAM JOURNAL ANALYSIS EXPORT
 Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -389,6 +507,134 @@ Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             return None
 
 
+def _dream_frame(dreams):
+    """Build the typed columnar view of dream fields"""
+    df = pd.DataFrame({
+        # Day precision is all the charts plot
+        'date': pd.to_datetime([dream.get('date', '')[:10] for dream in dreams],
+                               format='%Y-%m-%d', errors='coerce', cache=True),
+        'lucid': [dream.get('lucid', False) for dream in dreams],
+        'sleep_quality': [dream.get('sleep_quality', 0) for dream in dreams]
+    })
+    return df.astype(FRAME_DTYPES)
+
+
+def _figure_png(fig):
+    """Render a figure to PNG bytes without registering it with pyplot"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf)
+    return buf.getvalue()
+
+
+@st.cache_resource(show_spinner=False)
+def _sentiment_analyzer():
+    """Shared lexicon-based analyzer, so each text skips the full TextBlob wrapper"""
+    from textblob.sentiments import PatternAnalyzer
+    return PatternAnalyzer()
+
+
+@st.cache_resource(show_spinner=False)
+def _stopwords():
+    """Word cloud stopwords, built once per process"""
+    from wordcloud import STOPWORDS
+    return frozenset(STOPWORDS)
+
+
+@lru_cache(maxsize=4096)
+def _polarity(text):
+    """Sentiment polarity of a text; the pattern lexicon lookup is deterministic"""
+    return _sentiment_analyzer().analyze(text).polarity
+
+
+def _emotion_rgba(dreams):
+    """Map each dream's emotion to an RGBA row"""
+    from matplotlib.colors import to_rgba_array
+    return to_rgba_array([EMOTION_COLORS.get(dream.get('emotion', 'Unknown'), 'gray') for dream in dreams])
+
+
+# The key changes on every save, so keep only the few newest frames
+@st.cache_data(show_spinner=False, max_entries=4)
+def _search_frame(dream_count, last_date, _dreams):
+    """Build the pre-lowercased search columns, cached per journal size"""
+    df = pd.DataFrame({
+        'title': [dream.get('title', '') for dream in _dreams],
+        'description': [dream.get('description', '') for dream in _dreams],
+        'tags': [dream.get('tags', ()) for dream in _dreams]
+    })
+    df['title_l'] = df.title.str.lower()
+    df['desc_l'] = df.description.str.lower()
+    # Join with a separator no query can contain so matches never span two tags
+    df['tags_joined_l'] = df.tags.map(lambda ts: '\x00'.join(ts).lower())
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _render_wordcloud_png(frequencies, width, height):
+    """Render a word cloud for the given (word, count) pairs as PNG bytes"""
+    from wordcloud import WordCloud
+    from PIL import Image
+    
+    wordcloud = WordCloud(width=width, height=height,
+                          background_color='#2c3e50',
+                          colormap='viridis',
+                          collocations=False,
+                          max_words=100).generate_from_frequencies(dict(frequencies))
+    
+    buf = io.BytesIO()
+    Image.fromarray(wordcloud.to_array()).save(buf, 'PNG')
+    return buf.getvalue()
+
+
+def _compute_analysis(total_dreams, lucid_dreams, avg_sleep_quality, emotion_items, sentiment_items,
+                      common_tags, common_words, recent_titles):
+    """Build the analysis report from precomputed dream statistics"""
+    # Emotion analysis
+    emotion_counts = Counter(dict(emotion_items))
+    most_common_emotion = emotion_counts.most_common(1)[0] if emotion_counts else ('None', 0)
+    
+    # Sentiment analysis
+    sentiment_counts = dict(sentiment_items)
+    
+    format_counter = DreamJournal.format_counter
+    insights = DreamJournal.generate_insights(total_dreams, lucid_dreams, avg_sleep_quality, sentiment_counts)
+    
+    # Build analysis text
+    analysis = f"""
+DREAM JOURNAL ANALYSIS
+{'='*50}
+
+BASIC STATISTICS:
+• Total Dreams Recorded: {total_dreams}
+• Lucid Dreams: {lucid_dreams} ({lucid_dreams/total_dreams*100:.1f}%)
+• Average Sleep Quality: {avg_sleep_quality:.1f}/10
+
+EMOTIONAL PATTERNS:
+• Most Common Emotion: {most_common_emotion[0]} ({most_common_emotion[1]} times)
+• Emotion Distribution:
+{format_counter(emotion_counts, 2)}
+
+SENTIMENT ANALYSIS:
+• Positive Dreams: {sentiment_counts.get('positive', 0)}
+• Negative Dreams: {sentiment_counts.get('negative', 0)}
+• Neutral Dreams: {sentiment_counts.get('neutral', 0)}
+
+COMMON THEMES (Tags):
+{format_counter(dict(common_tags), 2) if common_tags else '  No tags found'}
+
+FREQUENT WORDS IN DREAMS:
+{format_counter(dict(common_words), 2)}
+
+RECENT DREAM TITLES:
+{chr(10).join([f"• {title} ({date})" for title, date in recent_titles])}
+
+INSIGHTS:
+{insights}
+        """
+    
+    return analysis
+
+
 def main():
     """Main function to run the Dream Journal application"""
     st.set_page_config(
@@ -474,12 +720,15 @@ def main():
         
         col1, col2 = st.columns([3, 1])
         
+        # Compute once and share between the report and the export
+        analysis = dream_journal.get_analysis()
+        
         with col2:
             if st.button("Refresh Analysis"):
                 st.experimental_rerun()
             
             # Export analysis
-            export_content = dream_journal.export_analysis()
+            export_content = dream_journal.export_analysis(analysis)
             if export_content:
                 st.download_button(
                     label="Export Analysis",
@@ -490,7 +739,6 @@ def main():
         
         with col1:
             st.subheader("Dream Statistics")
-            analysis = dream_journal.get_analysis()
             st.text(analysis)
     
     elif tab == "Visualizations":
@@ -500,33 +748,35 @@ def main():
                                ["Emotion Timeline", "Tag Cloud", "Sleep Quality Chart"])
         
         if viz_type == "Emotion Timeline":
-            fig = dream_journal.show_emotion_timeline()
-            if fig:
-                st.pyplot(fig)
+            png_bytes = dream_journal.show_emotion_timeline()
+            if png_bytes:
+                st.image(png_bytes)
                 
         elif viz_type == "Tag Cloud":
-            fig = dream_journal.show_word_cloud()
-            if fig:
-                st.pyplot(fig)
+            png_bytes = dream_journal.show_word_cloud()
+            if png_bytes:
+                st.image(png_bytes, caption="Dream Themes Word Cloud")
                 
         elif viz_type == "Sleep Quality Chart":
-            fig = dream_journal.show_quality_chart()
-            if fig:
-                st.pyplot(fig)
+            png_bytes = dream_journal.show_quality_chart()
+            if png_bytes:
+                st.image(png_bytes)
     
     elif tab == "Search Dreams":
         st.header("Search & Browse Dreams")
         
-        col1, col2, col3 = st.columns([2, 1, 1])
-        
-        with col1:
-            search_query = st.text_input("Search:", key="search_input")
-        
-        with col2:
-            search_button = st.button("Search")
-        
-        with col3:
-            show_all_button = st.button("Show All")
+        # Submit-only form so typing in the search box doesn't rerun the script
+        with st.form("search_form"):
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                search_query = st.text_input("Search:", key="search_input")
+            
+            with col2:
+                search_button = st.form_submit_button("Search")
+            
+            with col3:
+                show_all_button = st.form_submit_button("Show All")
         
         if search_button and search_query:
             results = dream_journal.search_dreams(search_query)